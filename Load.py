@@ -2,23 +2,31 @@
 
 from __future__ import annotations
 
+import functools
+import io
 import os
-from typing import Dict, Iterable, Sequence, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, Iterator, Literal, Mapping, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 import psycopg2
 from psycopg2.extensions import connection as PGConnection
 from psycopg2.extras import execute_values
 
 # Default connection details. Override them with POSTGRES_* environment variables
-# if your database uses different values.
-DEFAULT_SETTINGS: Dict[str, str] = {
-    "POSTGRES_HOST": "127.0.0.1",
-    "POSTGRES_PORT": "5432",
-    "POSTGRES_DATABASE": "etl_db",
-    "POSTGRES_USER": "etl_user",
-    "POSTGRES_PASSWORD": "etl_password",
-}
+# if your database uses different values. The mapping is read-only so the
+# defaults cannot be changed by accident at runtime.
+DEFAULT_SETTINGS: Mapping[str, str] = MappingProxyType(
+    {
+        "POSTGRES_HOST": "127.0.0.1",
+        "POSTGRES_PORT": "5432",
+        "POSTGRES_DATABASE": "etl_db",
+        "POSTGRES_USER": "etl_user",
+        "POSTGRES_PASSWORD": "etl_password",
+    }
+)
 
 
 def get_database_settings() -> Dict[str, str]:
@@ -38,29 +46,68 @@ def create_connection() -> PGConnection:
         password=settings["POSTGRES_PASSWORD"],
         host=settings["POSTGRES_HOST"],
         port=settings["POSTGRES_PORT"],
+        # Keep the socket alive during long bulk loads.
+        keepalives=1,
+        keepalives_idle=30,
+        keepalives_interval=10,
+        keepalives_count=3,
+        # Every run reloads the tables from the CSV files, so there is no
+        # need to wait for the WAL flush on each commit.
+        options="-c synchronous_commit=off -c client_min_messages=warning",
     )
 
 
-def load_order_summary(connection: PGConnection, summary: pd.DataFrame) -> None:
-    """Drop and recreate the order_summary table, then insert the rows."""
+ORDER_SUMMARY_COLUMNS: Sequence[str] = (
+    "order_id",
+    "order_date",
+    "customer_id",
+    "customer_name",
+    "order_total",
+)
+
+
+def load_order_summary(
+    connection: PGConnection,
+    summary: pd.DataFrame,
+    mode: Literal["replace", "truncate", "append"] = "truncate",
+    batch_size: int = 10_000,
+    use_copy: bool = True,
+) -> None:
+    """Make sure the order_summary table exists, then insert the rows.
+
+    ``mode`` decides what happens to an existing table: ``"truncate"`` empties
+    it, ``"replace"`` drops and recreates it and ``"append"`` keeps its rows.
+    A table whose columns no longer match is always recreated. The rows are
+    streamed with ``COPY``, or sent in ``INSERT`` statements of ``batch_size``
+    rows each when ``use_copy`` is false.
+    """
+
+    if mode not in ("replace", "truncate", "append"):
+        raise ValueError(f"Unknown load mode: {mode!r}")
 
-    rows = [
-        (
-            int(row.order_id),
-            row.order_date.date(),
-            int(row.customer_id),
-            row.customer_name,
-            float(row.order_total),
-        )
-        for row in summary.itertuples(index=False)
-    ]
+    summary = summary.astype(
+        {"order_id": "int64", "customer_id": "int64", "order_total": "float64"}
+    )
 
     with connection:
         with connection.cursor() as cursor:
-            cursor.execute("DROP TABLE IF EXISTS order_summary;")
             cursor.execute(
                 """
-                CREATE TABLE order_summary (
+                SELECT column_name
+                FROM information_schema.columns
+                WHERE table_schema = current_schema() AND table_name = 'order_summary'
+                ORDER BY ordinal_position;
+                """
+            )
+            existing_columns = tuple(column for (column,) in cursor.fetchall())
+            if mode == "replace" or (
+                existing_columns and existing_columns != tuple(ORDER_SUMMARY_COLUMNS)
+            ):
+                cursor.execute("DROP TABLE IF EXISTS order_summary;")
+
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS order_summary (
                     order_id INTEGER PRIMARY KEY,
                     order_date DATE,
                     customer_id INTEGER,
@@ -69,15 +116,18 @@ def load_order_summary(connection: PGConnection, summary: pd.DataFrame) -> None:
                 );
                 """
             )
-            cursor.executemany(
-                """
-                INSERT INTO order_summary (
-                    order_id, order_date, customer_id, customer_name, order_total
-                ) VALUES (%s, %s, %s, %s, %s);
-                """,
-                rows,
+            if mode == "truncate":
+                cursor.execute("TRUNCATE TABLE order_summary;")
+
+            count = _insert_rows(
+                cursor,
+                "order_summary",
+                ORDER_SUMMARY_COLUMNS,
+                summary,
+                use_copy=use_copy,
+                page_size=batch_size,
             )
-            print(f"Saved {len(rows)} rows to the order_summary table.")
+            print(f"Saved {count} rows to the order_summary table.")
 
 
 TABLE_COLUMNS: Dict[str, Sequence[str]] = {
@@ -319,33 +369,86 @@ IDENTITY_TABLES: Dict[str, str] = {
 }
 
 
-def _iter_rows(frame: pd.DataFrame, columns: Sequence[str]) -> Iterable[Tuple]:
-    selected = frame.loc[:, list(columns)]
-    for row in selected.itertuples(index=False, name=None):
-        yield tuple(_coerce_db_value(value) for value in row)
+def _normalize_frame(frame: pd.DataFrame, columns: Sequence[str]) -> Iterator[Tuple]:
+    """Yield ``frame[columns]`` as row tuples of plain Python values.
+
+    Each column is converted in one vectorised pass: missing values become
+    ``None`` and timestamps become ``datetime`` objects that psycopg2 can adapt.
+    The rows themselves are zipped lazily, so no list of tuples is built.
+    """
+
+    normalized = []
+    for column in columns:
+        series = frame[column]
+        values = series
+        if pd.api.types.is_datetime64_any_dtype(series.dtype):
+            values = series.dt.to_pydatetime()
+
+        # Only columns that actually contain gaps pay for the object copy.
+        missing = series.isna().to_numpy()
+        if missing.any():
+            values = np.where(missing, None, np.asarray(values, dtype=object))
+        normalized.append(values.tolist())
+    return zip(*normalized)
+
+
+def _insert_rows(
+    cursor,
+    table_name: str,
+    columns: Sequence[str],
+    frame: pd.DataFrame,
+    use_copy: bool = False,
+    page_size: int = 10_000,
+    buffer: io.StringIO | None = None,
+) -> int:
+    """Bulk insert ``frame[columns]`` into ``table_name`` and return the row count.
+
+    Rows are sent as multi-row ``INSERT ... VALUES`` pages via ``execute_values``.
+    With ``use_copy`` the frame is streamed through ``COPY ... FROM STDIN`` as CSV
+    instead, which is the fastest way to get large frames into PostgreSQL. A
+    ``buffer`` already built by :func:`_csv_buffer` is copied as is.
+    """
+
+    columns = tuple(columns)
+
+    if use_copy:
+        if buffer is None:
+            buffer = _csv_buffer(frame, columns)
+        cursor.copy_expert(_build_copy_stmt(table_name, columns), buffer)
+        return len(frame)
+
+    insert_sql, template = _build_insert_stmt(table_name, columns)
+    rows = _normalize_frame(frame, columns)
+    execute_values(cursor, insert_sql, rows, template=template, page_size=page_size)
+    return len(frame)
 
 
-def _coerce_db_value(value):
-    if pd.isna(value):
-        return None
-    if isinstance(value, pd.Timestamp):
-        return value.to_pydatetime()
-    if hasattr(value, "item"):
-        try:
-            return value.item()
-        except ValueError:
-            pass
-    return value
+def _csv_buffer(frame: pd.DataFrame, columns: Sequence[str]) -> io.StringIO:
+    buffer = io.StringIO()
+    frame.loc[:, list(columns)].to_csv(buffer, index=False, header=False, na_rep="")
+    buffer.seek(0)
+    return buffer
+
+
+# Table and column names come from TABLE_COLUMNS, so the statements are static
+# per table and can be rendered once and reused.
+@functools.lru_cache(maxsize=32)
+def _build_insert_stmt(table_name: str, columns: Tuple[str, ...]) -> Tuple[str, str]:
+    insert_sql = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES %s"
+    template = "(" + ",".join(["%s"] * len(columns)) + ")"
+    return insert_sql, template
+
+
+@functools.lru_cache(maxsize=32)
+def _build_copy_stmt(table_name: str, columns: Tuple[str, ...]) -> str:
+    return f"COPY {table_name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT CSV)"
 
 
 def _ensure_schema(cursor) -> None:
     """Create the relational schema if it does not already exist."""
 
-    for statement in CREATE_TABLE_STATEMENTS:
-        cursor.execute(statement)
-
-    for statement in CREATE_INDEX_STATEMENTS:
-        cursor.execute(statement)
+    # Send every CREATE statement in one round trip instead of one each.
+    cursor.execute("\n".join((*CREATE_TABLE_STATEMENTS, *CREATE_INDEX_STATEMENTS)))
 
 
 def load_core_tables(connection: PGConnection, tables: Dict[str, pd.DataFrame]) -> None:
@@ -359,18 +462,28 @@ def load_core_tables(connection: PGConnection, tables: Dict[str, pd.DataFrame])
                 "customers, stores, categories, brands RESTART IDENTITY CASCADE;"
             )
 
-            for table_name in LOAD_ORDER:
-                frame = tables[table_name]
-                columns = TABLE_COLUMNS[table_name]
-                rows = list(_iter_rows(frame, columns))
-                if not rows:
-                    continue
-
-                insert_sql = (
-                    f"INSERT INTO {table_name} (" + ", ".join(columns) + ") VALUES %s"
-                )
-                execute_values(cursor, insert_sql, rows)
-                print(f"Loaded {len(rows)} rows into {table_name}.")
+            # Turning a frame into CSV does not need the database, so the
+            # buffers are built in worker threads while earlier tables are
+            # still being copied. The COPYs themselves stay on this connection,
+            # in LOAD_ORDER, so the foreign keys and the transaction still hold.
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                buffers = {
+                    table_name: executor.submit(
+                        _csv_buffer, tables[table_name], TABLE_COLUMNS[table_name]
+                    )
+                    for table_name in LOAD_ORDER
+                    if not tables[table_name].empty
+                }
+                for table_name, buffer in buffers.items():
+                    count = _insert_rows(
+                        cursor,
+                        table_name,
+                        TABLE_COLUMNS[table_name],
+                        tables[table_name],
+                        use_copy=True,
+                        buffer=buffer.result(),
+                    )
+                    print(f"Loaded {count} rows into {table_name}.")
 
             for table_name, column in IDENTITY_TABLES.items():
                 cursor.execute(
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict
 
+import numpy as np
 import pandas as pd
 
 
@@ -22,8 +24,8 @@ def prepare_relational_tables(raw: Dict[str, pd.DataFrame]) -> Dict[str, pd.Data
         tables["categories"]["category_id"].astype(int)
     )
 
-    stores = raw["stores"].copy()
-    stores = stores.rename(columns={"name": "store_name"})
+    # rename() already returns a new frame, so the raw input is never mutated.
+    stores = raw["stores"].rename(columns={"name": "store_name"})
     stores.insert(0, "store_id", range(1, len(stores) + 1))
     tables["stores"] = stores[
         [
@@ -43,7 +45,7 @@ def prepare_relational_tables(raw: Dict[str, pd.DataFrame]) -> Dict[str, pd.Data
         zip(tables["stores"]["store_name"], tables["stores"]["store_id"])
     )
 
-    customers = raw["customers"].copy()
+    customers = raw["customers"]
     tables["customers"] = customers[
         [
             "customer_id",
@@ -61,7 +63,7 @@ def prepare_relational_tables(raw: Dict[str, pd.DataFrame]) -> Dict[str, pd.Data
         tables["customers"]["customer_id"].astype(int)
     )
 
-    products = raw["products"].copy()
+    products = raw["products"]
     tables["products"] = products[
         [
             "product_id",
@@ -86,8 +88,7 @@ def prepare_relational_tables(raw: Dict[str, pd.DataFrame]) -> Dict[str, pd.Data
         tables["products"]["list_price"].astype(float)
     )
 
-    staffs = raw["staffs"].copy()
-    staffs = staffs.rename(
+    staffs = raw["staffs"].rename(
         columns={
             "name": "first_name",
             "last_name": "last_name",
@@ -119,46 +120,46 @@ def prepare_relational_tables(raw: Dict[str, pd.DataFrame]) -> Dict[str, pd.Data
         zip(tables["staffs"]["first_name"], tables["staffs"]["staff_id"])
     )
 
-    stocks = raw["stocks"].copy()
-    stocks["store_id"] = stocks["store_name"].map(store_lookup)
-    tables["stocks"] = stocks[["store_id", "product_id", "quantity"]].copy()
-    tables["stocks"]["store_id"] = tables["stocks"]["store_id"].astype(int)
-    tables["stocks"]["product_id"] = (
-        tables["stocks"]["product_id"].astype(int)
+    stocks = raw["stocks"]
+    tables["stocks"] = pd.DataFrame(
+        {
+            "store_id": stocks["store_name"].map(store_lookup).astype(int),
+            "product_id": stocks["product_id"].astype(int),
+            "quantity": stocks["quantity"].astype(int),
+        }
     )
-    tables["stocks"]["quantity"] = tables["stocks"]["quantity"].astype(int)
 
-    orders = raw["orders"].copy()
-    orders["order_date"] = pd.to_datetime(
-        orders["order_date"], format="%d/%m/%Y", errors="coerce"
-    )
-    orders["required_date"] = pd.to_datetime(
-        orders["required_date"], format="%d/%m/%Y", errors="coerce"
-    )
-    orders["shipped_date"] = pd.to_datetime(
-        orders["shipped_date"], format="%d/%m/%Y", errors="coerce"
+    # Build the orders table straight from the converted columns instead of
+    # copying the raw frame first and overwriting its columns one by one.
+    orders = raw["orders"]
+    tables["orders"] = pd.DataFrame(
+        {
+            "order_id": orders["order_id"].astype(int),
+            "customer_id": orders["customer_id"].astype(int),
+            "store_id": orders["store"].map(store_lookup).astype(int),
+            "staff_id": orders["staff_name"].map(staff_lookup).astype(int),
+            "order_status": orders["order_status"].astype(int),
+            # Many orders share the same dates, so let pandas parse each
+            # distinct string once (cache=True) using the fixed-format fast path.
+            **{
+                column: pd.to_datetime(
+                    orders[column], format="%d/%m/%Y", errors="coerce", cache=True
+                )
+                for column in ("order_date", "required_date", "shipped_date")
+            },
+        }
     )
-    orders["store_id"] = orders["store"].map(store_lookup)
-    orders["staff_id"] = orders["staff_name"].map(staff_lookup)
-    orders["order_status"] = orders["order_status"].astype(int)
-    orders["order_id"] = orders["order_id"].astype(int)
-    orders["customer_id"] = orders["customer_id"].astype(int)
-    orders["store_id"] = orders["store_id"].astype(int)
-    orders["staff_id"] = orders["staff_id"].astype(int)
-    tables["orders"] = orders[
-        [
-            "order_id",
-            "customer_id",
-            "store_id",
-            "staff_id",
-            "order_status",
-            "order_date",
-            "required_date",
-            "shipped_date",
-        ]
-    ].copy()
 
-    items = raw["order_items"].copy()
+    # Extract.extract_data already reads these columns with their final
+    # dtypes, so they are used as they are instead of being cast again.
+    items = raw["order_items"]
+    assert all(
+        items[column].dtype.kind == "i"
+        for column in ("order_id", "item_id", "product_id", "quantity")
+    ), "order_items ids and quantity must be read as integers"
+    assert all(
+        items[column].dtype.kind == "f" for column in ("list_price", "discount")
+    ), "order_items prices and discounts must be read as floats"
     tables["order_items"] = items[
         [
             "order_id",
@@ -168,25 +169,7 @@ def prepare_relational_tables(raw: Dict[str, pd.DataFrame]) -> Dict[str, pd.Data
             "list_price",
             "discount",
         ]
-    ].copy()
-    tables["order_items"]["order_id"] = (
-        tables["order_items"]["order_id"].astype(int)
-    )
-    tables["order_items"]["item_id"] = (
-        tables["order_items"]["item_id"].astype(int)
-    )
-    tables["order_items"]["product_id"] = (
-        tables["order_items"]["product_id"].astype(int)
-    )
-    tables["order_items"]["quantity"] = (
-        tables["order_items"]["quantity"].astype(int)
-    )
-    tables["order_items"]["list_price"] = (
-        tables["order_items"]["list_price"].astype(float)
-    )
-    tables["order_items"]["discount"] = (
-        tables["order_items"]["discount"].astype(float)
-    )
+    ]
 
     return tables
 
@@ -194,36 +177,60 @@ def prepare_relational_tables(raw: Dict[str, pd.DataFrame]) -> Dict[str, pd.Data
 def build_order_summary(tables: Dict[str, pd.DataFrame]) -> pd.DataFrame:
     """Create a friendly summary table ready for loading into PostgreSQL."""
 
-    orders = tables["orders"].copy()
-    items = tables["order_items"].copy()
-    customers = tables["customers"].copy()
-
-    # Work out how much each order is worth.
-    items["line_total"] = (
-        items["quantity"].astype(float)
-        * items["list_price"].astype(float)
-        * (1 - items["discount"].astype(float))
+    # The order totals and the customer names do not depend on each other, so
+    # work them out side by side and only wait for them when they are used. The
+    # input frames are only read, never modified, so they are not copied.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        totals = executor.submit(_order_totals, tables["order_items"])
+        customer_names = executor.submit(_customer_names, tables["customers"])
+
+        # Both lookups are indexed by a unique key, so a map() per column is
+        # all that is needed; no joined copy of the orders frame is built.
+        orders = tables["orders"]
+        summary = pd.DataFrame(
+            {
+                "order_id": orders["order_id"],
+                "order_date": orders["order_date"],
+                "customer_id": orders["customer_id"],
+                "customer_name": orders["customer_id"].map(customer_names.result()),
+                "order_total": orders["order_id"].map(totals.result()).fillna(0.0),
+            }
+        )
+
+    return summary
+
+
+def _order_totals(items: pd.DataFrame) -> pd.Series:
+    """Work out how much each order is worth, indexed by ``order_id``."""
+
+    # The arithmetic runs on the raw NumPy arrays and reuses one output buffer
+    # instead of a chain of Series.
+    quantity = items["quantity"].to_numpy(dtype=np.float64)
+    list_price = items["list_price"].to_numpy(dtype=np.float64)
+    discount = items["discount"].to_numpy(dtype=np.float64)
+    line_total = quantity * list_price
+    line_total *= 1.0 - discount
+
+    # Sum the line totals per order in one pass without sorting: factorize the
+    # ids into dense codes and let bincount add each line into its order's slot.
+    codes, order_ids = pd.factorize(items["order_id"])
+    return pd.Series(
+        np.bincount(codes, weights=line_total, minlength=len(order_ids)),
+        index=pd.Index(order_ids, name="order_id"),
+        name="order_total",
+    )
+
+
+def _customer_names(customers: pd.DataFrame) -> pd.Series:
+    """Join first and last names, indexed by ``customer_id``."""
+
+    return (
+        customers["first_name"]
+        .str.cat(customers["last_name"], sep=" ", na_rep="")
+        .str.strip()
+        .set_axis(customers["customer_id"])
+        .rename("customer_name")
     )
-    totals = (
-        items.groupby("order_id", as_index=False)["line_total"].sum()
-        .rename(columns={"line_total": "order_total"})
-    )
-
-    # Add the customer names to the orders table.
-    customers["customer_name"] = (
-        customers["first_name"].fillna("") + " " + customers["last_name"].fillna("")
-    ).str.strip()
-    customer_details = customers[["customer_id", "customer_name"]]
-
-    summary = (
-        orders.merge(totals, on="order_id", how="left")
-        .merge(customer_details, on="customer_id", how="left")
-        .fillna({"order_total": 0})
-    )
-
-    summary["order_total"] = summary["order_total"].astype(float)
-
-    return summary[["order_id", "order_date", "customer_id", "customer_name", "order_total"]]
 
 
 __all__ = ["build_order_summary", "prepare_relational_tables"]
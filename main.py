@@ -2,27 +2,42 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+
 from Extract import extract_data
 from Load import create_connection, load_core_tables, load_order_summary
 from Transform import build_order_summary, prepare_relational_tables
 
 
-def run_pipeline() -> None:
-    """Run the three ETL steps and print friendly progress messages."""
+def run_pipeline(batch_size: int = 10_000, use_copy: bool = True) -> None:
+    """Run the three ETL steps and print friendly progress messages.
+
+    The order summary is streamed into PostgreSQL with ``COPY``. Set
+    ``use_copy`` to false to send it in ``INSERT`` statements of
+    ``batch_size`` rows instead.
+    """
 
     print("Step 1: Extracting the CSV files...")
     data = extract_data()
 
-    print("Step 2: Preparing relational tables and the order summary...")
+    print("Step 2: Preparing the relational tables...")
     tables = prepare_relational_tables(data)
-    summary = build_order_summary(tables)
-    print(summary.head())
 
     print("Step 3: Saving everything to PostgreSQL...")
     connection = create_connection()
     try:
-        load_core_tables(connection, tables)
-        load_order_summary(connection, summary)
+        # Loading the core tables is mostly waiting on the database, and the
+        # order summary only reads the same tables. Load them in a background
+        # thread and build the summary in the meantime.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            core_load = executor.submit(load_core_tables, connection, tables)
+            summary = build_order_summary(tables)
+            core_load.result()
+
+        print(summary.head())
+        load_order_summary(
+            connection, summary, batch_size=batch_size, use_copy=use_copy
+        )
     finally:
         connection.close()
 